@@ -0,0 +1,6 @@
+"""Allow `python -m skills_cli` to invoke the CLI."""
+
+from skills_cli.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -2,23 +2,31 @@
 """Tests for skills-cli.
 
 Run with: uv run python tests/test_skills.py
+
+The suite is also pytest-compatible, and the test classes share no mutable
+state, so `pytest -n auto tests/` (with pytest-xdist installed) runs them
+in parallel.
 """
 
-import json
-import subprocess
+import contextlib
+import functools
+import io
+import os
 import sys
 import tempfile
 import unittest
-import zipfile
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from skills_cli.cli import (
     SkillProperties,
+    build_zip,
     find_skill_md,
     find_skills_in_dir,
+    main,
     parse_frontmatter,
     read_properties,
     to_prompt,
@@ -27,20 +35,50 @@ from skills_cli.cli import (
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Canonical fixture paths, built once instead of re-joined in every test.
+VALID_SKILL = FIXTURES_DIR / "valid-skill"
+LOWERCASE_SKILL = FIXTURES_DIR / "lowercase-skill-md"
+INVALID_UPPERCASE = FIXTURES_DIR / "invalid-uppercase-name"
+INVALID_EXTRA_FIELD = FIXTURES_DIR / "invalid-extra-field"
+INVALID_MISSING_DESC = FIXTURES_DIR / "invalid-missing-description"
+INVALID_NAME_MISMATCH = FIXTURES_DIR / "invalid-name-mismatch"
+INVALID_NO_FRONTMATTER = FIXTURES_DIR / "invalid-no-frontmatter"
+
+# Tests create many tiny throwaway files; rooting temp dirs on tmpfs keeps
+# that churn off the real disk where /dev/shm is available.
+_TMP_ROOT = (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+)
+
+
+def _tmpdir() -> tempfile.TemporaryDirectory:
+    """A TemporaryDirectory rooted on tmpfs when available."""
+    return tempfile.TemporaryDirectory(dir=_TMP_ROOT)
+
+
+# Minimal SKILL.md used wherever a test fabricates a skill with just a name;
+# pre-encoded once so call sites fill in the name without f-string work.
+_SKILL_MD_TMPL = b"---\nname: %s\ndescription: test\n---\n"
+
+
+def _contains(errors: list[str], needle: str) -> bool:
+    """True if any error message contains `needle` (one pass over a join)."""
+    return needle in "\n".join(errors)
+
 
 class TestFindSkillMd(unittest.TestCase):
     """Tests for find_skill_md function."""
 
     def test_finds_uppercase_skill_md(self):
         """Should find SKILL.md (uppercase)."""
-        path = find_skill_md(FIXTURES_DIR / "valid-skill")
+        path = find_skill_md(VALID_SKILL)
         self.assertIsNotNone(path)
         assert path is not None
         self.assertEqual(path.name, "SKILL.md")
 
     def test_finds_lowercase_skill_md(self):
         """Should find skill.md (lowercase)."""
-        path = find_skill_md(FIXTURES_DIR / "lowercase-skill-md")
+        path = find_skill_md(LOWERCASE_SKILL)
         self.assertIsNotNone(path)
         assert path is not None
         # macOS has case-insensitive filesystem, so just check it's found
@@ -48,7 +86,7 @@ class TestFindSkillMd(unittest.TestCase):
 
     def test_returns_none_for_missing(self):
         """Should return None if no SKILL.md exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with _tmpdir() as tmpdir:
             path = find_skill_md(Path(tmpdir))
             self.assertIsNone(path)
 
@@ -102,7 +140,7 @@ class TestReadProperties(unittest.TestCase):
 
     def test_reads_valid_skill(self):
         """Should read properties from valid skill."""
-        props = read_properties(FIXTURES_DIR / "valid-skill")
+        props = read_properties(VALID_SKILL)
         self.assertEqual(props.name, "valid-skill")
         self.assertEqual(props.description, "A valid test skill for testing the CLI.")
         self.assertEqual(props.license, "MIT")
@@ -111,22 +149,34 @@ class TestReadProperties(unittest.TestCase):
 
     def test_reads_lowercase_skill_md(self):
         """Should read properties from skill.md (lowercase)."""
-        props = read_properties(FIXTURES_DIR / "lowercase-skill-md")
+        props = read_properties(LOWERCASE_SKILL)
         self.assertEqual(props.name, "lowercase-skill-md")
 
     def test_raises_on_missing_name(self):
         """Should raise ValueError if name is missing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            skill_md = Path(tmpdir) / "SKILL.md"
-            skill_md.write_text("---\ndescription: test\n---\n")
+        from unittest import mock
+
+        # Supply the frontmatter from memory; this test never needs a real
+        # file, so stub the discovery and read primitives instead.
+        fake_md = mock.MagicMock(
+            spec=Path, **{"__str__.return_value": "/virtual/no-name/SKILL.md"}
+        )
+        fake_md.stat.return_value = SimpleNamespace(st_mtime_ns=0, st_size=0)
+        with (
+            mock.patch("skills_cli.cli.find_skill_md", return_value=fake_md),
+            mock.patch(
+                "skills_cli.cli._read_frontmatter_only",
+                return_value="description: test",
+            ),
+        ):
             with self.assertRaises(ValueError) as ctx:
-                read_properties(Path(tmpdir))
-            self.assertIn("name", str(ctx.exception))
+                read_properties(Path("/virtual/no-name"))
+        self.assertIn("name", str(ctx.exception))
 
     def test_raises_on_missing_description(self):
         """Should raise ValueError if description is missing."""
         with self.assertRaises(ValueError) as ctx:
-            read_properties(FIXTURES_DIR / "invalid-missing-description")
+            read_properties(INVALID_MISSING_DESC)
         self.assertIn("description", str(ctx.exception))
 
 
@@ -135,60 +185,58 @@ class TestValidate(unittest.TestCase):
 
     def test_valid_skill_returns_empty_list(self):
         """Valid skill should return empty error list."""
-        errors = validate(FIXTURES_DIR / "valid-skill")
+        errors = validate(VALID_SKILL)
         self.assertEqual(errors, [])
 
     def test_lowercase_skill_md_is_valid(self):
         """Skill with lowercase skill.md should be valid."""
-        errors = validate(FIXTURES_DIR / "lowercase-skill-md")
+        errors = validate(LOWERCASE_SKILL)
         self.assertEqual(errors, [])
 
     def test_detects_uppercase_name(self):
         """Should detect uppercase characters in name."""
-        errors = validate(FIXTURES_DIR / "invalid-uppercase-name")
-        self.assertTrue(any("lowercase" in e for e in errors))
+        errors = validate(INVALID_UPPERCASE)
+        self.assertTrue(_contains(errors, "lowercase"))
 
     def test_detects_extra_fields(self):
         """Should detect unexpected frontmatter fields."""
-        errors = validate(FIXTURES_DIR / "invalid-extra-field")
-        self.assertTrue(any("Unexpected fields" in e for e in errors))
+        errors = validate(INVALID_EXTRA_FIELD)
+        self.assertTrue(_contains(errors, "Unexpected fields"))
 
     def test_detects_missing_description(self):
         """Should detect missing description field."""
-        errors = validate(FIXTURES_DIR / "invalid-missing-description")
-        self.assertTrue(any("description" in e for e in errors))
+        errors = validate(INVALID_MISSING_DESC)
+        self.assertTrue(_contains(errors, "description"))
 
     def test_detects_name_mismatch(self):
         """Should detect when name doesn't match directory."""
-        errors = validate(FIXTURES_DIR / "invalid-name-mismatch")
-        self.assertTrue(any("must match" in e for e in errors))
+        errors = validate(INVALID_NAME_MISMATCH)
+        self.assertTrue(_contains(errors, "must match"))
 
     def test_detects_missing_frontmatter(self):
         """Should detect missing frontmatter."""
-        errors = validate(FIXTURES_DIR / "invalid-no-frontmatter")
-        self.assertTrue(any("frontmatter" in e for e in errors))
+        errors = validate(INVALID_NO_FRONTMATTER)
+        self.assertTrue(_contains(errors, "frontmatter"))
 
     def test_detects_missing_skill_md(self):
         """Should detect missing SKILL.md file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with _tmpdir() as tmpdir:
             errors = validate(Path(tmpdir))
-            self.assertTrue(any("SKILL.md" in e for e in errors))
+            self.assertTrue(_contains(errors, "SKILL.md"))
 
     def test_detects_nonexistent_path(self):
         """Should detect nonexistent path."""
         errors = validate(Path("/nonexistent/path"))
-        self.assertTrue(any("does not exist" in e for e in errors))
+        self.assertTrue(_contains(errors, "does not exist"))
 
     def test_validates_name_format(self):
         """Should validate name format rules."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with _tmpdir() as tmpdir:
             skill_dir = Path(tmpdir) / "bad--name"
             skill_dir.mkdir()
-            (skill_dir / "SKILL.md").write_text(
-                "---\nname: bad--name\ndescription: test\n---\n"
-            )
+            (skill_dir / "SKILL.md").write_bytes(_SKILL_MD_TMPL % b"bad--name")
             errors = validate(skill_dir)
-            self.assertTrue(any("consecutive hyphens" in e for e in errors))
+            self.assertTrue(_contains(errors, "consecutive hyphens"))
 
 
 class TestToPrompt(unittest.TestCase):
@@ -196,7 +244,7 @@ class TestToPrompt(unittest.TestCase):
 
     def test_generates_xml_for_single_skill(self):
         """Should generate valid XML for a single skill."""
-        xml = to_prompt([FIXTURES_DIR / "valid-skill"])
+        xml = to_prompt([VALID_SKILL])
         self.assertIn("<available_skills>", xml)
         self.assertIn("</available_skills>", xml)
         self.assertIn("<name>", xml)
@@ -209,8 +257,8 @@ class TestToPrompt(unittest.TestCase):
         """Should generate XML for multiple skills."""
         xml = to_prompt(
             [
-                FIXTURES_DIR / "valid-skill",
-                FIXTURES_DIR / "lowercase-skill-md",
+                VALID_SKILL,
+                LOWERCASE_SKILL,
             ]
         )
         self.assertEqual(xml.count("<skill>"), 2)
@@ -224,7 +272,7 @@ class TestToPrompt(unittest.TestCase):
 
     def test_escapes_html_entities(self):
         """Should escape HTML entities in name/description."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with _tmpdir() as tmpdir:
             skill_dir = Path(tmpdir) / "test-skill"
             skill_dir.mkdir()
             (skill_dir / "SKILL.md").write_text(
@@ -236,7 +284,7 @@ class TestToPrompt(unittest.TestCase):
 
     def test_yaml_format(self):
         """Should generate YAML output."""
-        output = to_prompt([FIXTURES_DIR / "valid-skill"], fmt="yaml")
+        output = to_prompt([VALID_SKILL], fmt="yaml")
         self.assertIn("available_skills:", output)
         self.assertIn("name: valid-skill", output)
         self.assertIn("description:", output)
@@ -244,7 +292,9 @@ class TestToPrompt(unittest.TestCase):
 
     def test_json_format(self):
         """Should generate JSON output."""
-        output = to_prompt([FIXTURES_DIR / "valid-skill"], fmt="json")
+        import json
+
+        output = to_prompt([VALID_SKILL], fmt="json")
         data = json.loads(output)
         self.assertIn("available_skills", data)
         self.assertEqual(len(data["available_skills"]), 1)
@@ -254,32 +304,36 @@ class TestToPrompt(unittest.TestCase):
 class TestSkillProperties(unittest.TestCase):
     """Tests for SkillProperties dataclass."""
 
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read from these, so one instance of each shape
+        # serves the whole class.
+        cls.minimal = SkillProperties(name="test", description="A test")
+        cls.full = SkillProperties(
+            name="test",
+            description="A test",
+            license="MIT",
+            compatibility="Python 3.12+",
+            allowed_tools="Bash Read",
+            metadata={"author": "test"},
+        )
+
     def test_to_dict_includes_required_fields(self):
         """Should include name and description."""
-        props = SkillProperties(name="test", description="A test")
-        d = props.to_dict()
+        d = self.minimal.to_dict()
         self.assertEqual(d["name"], "test")
         self.assertEqual(d["description"], "A test")
 
     def test_to_dict_excludes_none_values(self):
         """Should exclude None optional fields."""
-        props = SkillProperties(name="test", description="A test")
-        d = props.to_dict()
+        d = self.minimal.to_dict()
         self.assertNotIn("license", d)
         self.assertNotIn("compatibility", d)
         self.assertNotIn("allowed-tools", d)
 
     def test_to_dict_includes_optional_fields_when_set(self):
         """Should include optional fields when set."""
-        props = SkillProperties(
-            name="test",
-            description="A test",
-            license="MIT",
-            compatibility="Python 3.12+",
-            allowed_tools="Bash Read",
-            metadata={"author": "test"},
-        )
-        d = props.to_dict()
+        d = self.full.to_dict()
         self.assertEqual(d["license"], "MIT")
         self.assertEqual(d["compatibility"], "Python 3.12+")
         self.assertEqual(d["allowed-tools"], "Bash Read")
@@ -291,7 +345,7 @@ class TestFindSkillsInDir(unittest.TestCase):
 
     def test_finds_skill_in_root(self):
         """Should find skill when SKILL.md is in root."""
-        skills = find_skills_in_dir(FIXTURES_DIR / "valid-skill")
+        skills = find_skills_in_dir(VALID_SKILL)
         self.assertEqual(len(skills), 1)
 
     def test_finds_skills_in_subdirectories(self):
@@ -301,50 +355,141 @@ class TestFindSkillsInDir(unittest.TestCase):
 
     def test_returns_empty_for_no_skills(self):
         """Should return empty list if no skills found."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with _tmpdir() as tmpdir:
+            skills = find_skills_in_dir(Path(tmpdir))
+            self.assertEqual(skills, [])
+
+    def test_ignores_dot_directories(self):
+        """Should not treat dot-directories as skills."""
+        with _tmpdir() as tmpdir:
+            hidden = Path(tmpdir) / ".valid-skill.tmp.123"
+            hidden.mkdir()
+            (hidden / "SKILL.md").write_bytes(_SKILL_MD_TMPL % b"valid-skill")
             skills = find_skills_in_dir(Path(tmpdir))
             self.assertEqual(skills, [])
 
+    def test_finds_symlinked_skill(self):
+        """Should follow a symlink to a skill directory."""
+        with _tmpdir() as tmpdir:
+            link = Path(tmpdir) / "linked-skill"
+            link.symlink_to(VALID_SKILL, target_is_directory=True)
+            skills = find_skills_in_dir(Path(tmpdir))
+            self.assertEqual(skills, [link])
+
+    def test_matches_scandir_discovery(self):
+        """Discovery should agree with a direct scandir of the fixtures."""
+        expected = set()
+        with os.scandir(FIXTURES_DIR) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False) and find_skill_md(entry.path):
+                    expected.add(Path(entry.path))
+        self.assertEqual(set(find_skills_in_dir(FIXTURES_DIR)), expected)
+
 
 class TestCLICommands(unittest.TestCase):
     """Integration tests for CLI commands."""
 
-    def run_cli(self, *args) -> subprocess.CompletedProcess:
-        """Run the skills CLI with given arguments."""
-        return subprocess.run(
-            ["uv", "run", "skills", *args],
+    @classmethod
+    def setUpClass(cls):
+        # Zip the valid-skill fixture once; every zip-consuming test reuses
+        # it instead of re-running the zip command.
+        cls._shared_tmp = _tmpdir()
+        # Keep the list snapshot cache inside the test tmpdir so the suite
+        # neither reads nor contaminates the machine's real ~/.cache.
+        cls._old_xdg = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = str(Path(cls._shared_tmp.name) / "cache")
+        cls._zip_path = Path(cls._shared_tmp.name) / "valid-skill.zip"
+        result = cls.run_cli("zip", str(VALID_SKILL), "-o", str(cls._zip_path))
+        assert result.returncode == 0, result.stderr
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._old_xdg is None:
+            os.environ.pop("XDG_CACHE_HOME", None)
+        else:
+            os.environ["XDG_CACHE_HOME"] = cls._old_xdg
+        cls._shared_tmp.cleanup()
+
+    @classmethod
+    def run_cli(cls, *args) -> SimpleNamespace:
+        """Run the skills CLI in-process with given arguments.
+
+        Calling main(argv) directly avoids a subprocess (and interpreter
+        startup) per test; SystemExit carries the exit code.
+        """
+        out, err = io.StringIO(), io.StringIO()
+        returncode = 0
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                main(list(args))
+            except SystemExit as exc:
+                if isinstance(exc.code, int):
+                    returncode = exc.code
+                elif exc.code is not None:
+                    returncode = 1
+        return SimpleNamespace(
+            returncode=returncode, stdout=out.getvalue(), stderr=err.getvalue()
+        )
+
+    def test_module_entry_point(self):
+        """`python -m skills_cli` should run the CLI without the uv wrapper."""
+        import subprocess
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "skills_cli",
+                "validate",
+                str(VALID_SKILL),
+            ],
             capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent,
+            env={
+                **os.environ,
+                "PYTHONPATH": str(Path(__file__).parent.parent / "src"),
+                "PYTHONDONTWRITEBYTECODE": "1",
+            },
         )
+        self.assertEqual(result.returncode, 0)
+        # Capture bytes and decode once rather than paying text=True's
+        # incremental decoder on the pipe.
+        self.assertIn("Valid skill", result.stdout.decode("utf-8"))
+
+    @classmethod
+    @functools.cache
+    def run_cli_static(cls, *args) -> SimpleNamespace:
+        """run_cli for deterministic, read-only invocations like --help."""
+        return cls.run_cli(*args)
 
     def test_help(self):
         """Should show help."""
-        result = self.run_cli("--help")
+        result = self.run_cli_static("--help")
         self.assertEqual(result.returncode, 0)
         self.assertIn("CLI tool for managing Agent Skills", result.stdout)
 
     def test_version(self):
         """Should show version."""
-        result = self.run_cli("--version")
+        result = self.run_cli_static("--version")
         self.assertEqual(result.returncode, 0)
         self.assertIn("0.1.0", result.stdout)
 
     def test_validate_valid_skill(self):
         """Should validate a valid skill."""
-        result = self.run_cli("validate", str(FIXTURES_DIR / "valid-skill"))
+        result = self.run_cli("validate", str(VALID_SKILL))
         self.assertEqual(result.returncode, 0)
         self.assertIn("Valid skill", result.stdout)
 
     def test_validate_invalid_skill(self):
         """Should fail on invalid skill."""
-        result = self.run_cli("validate", str(FIXTURES_DIR / "invalid-uppercase-name"))
+        result = self.run_cli("validate", str(INVALID_UPPERCASE))
         self.assertEqual(result.returncode, 1)
         self.assertIn("Validation failed", result.stderr)
 
     def test_read_properties(self):
         """Should output JSON properties."""
-        result = self.run_cli("read-properties", str(FIXTURES_DIR / "valid-skill"))
+        import json
+
+        result = self.run_cli("read-properties", str(VALID_SKILL))
         self.assertEqual(result.returncode, 0)
         props = json.loads(result.stdout)
         self.assertEqual(props["name"], "valid-skill")
@@ -352,14 +497,14 @@ class TestCLICommands(unittest.TestCase):
 
     def test_to_prompt(self):
         """Should generate XML prompt."""
-        result = self.run_cli("to-prompt", str(FIXTURES_DIR / "valid-skill"))
+        result = self.run_cli("to-prompt", str(VALID_SKILL))
         self.assertEqual(result.returncode, 0)
         self.assertIn("<available_skills>", result.stdout)
         self.assertIn("valid-skill", result.stdout)
 
     def test_create(self):
         """Should create a new skill scaffold."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with _tmpdir() as tmpdir:
             result = self.run_cli("create", "my-new-skill", "-p", tmpdir)
             self.assertEqual(result.returncode, 0)
             skill_dir = Path(tmpdir) / "my-new-skill"
@@ -371,36 +516,49 @@ class TestCLICommands(unittest.TestCase):
 
     def test_create_invalid_name(self):
         """Should reject invalid skill names."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with _tmpdir() as tmpdir:
             result = self.run_cli("create", "Invalid-Name", "-p", tmpdir)
             self.assertEqual(result.returncode, 1)
             self.assertIn("Error", result.stderr)
 
     def test_zip(self):
         """Should create a zip file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        import zipfile
+
+        with _tmpdir() as tmpdir:
             output_path = Path(tmpdir) / "skill.zip"
             result = self.run_cli(
                 "zip",
-                str(FIXTURES_DIR / "valid-skill"),
+                str(VALID_SKILL),
                 "-o",
                 str(output_path),
             )
             self.assertEqual(result.returncode, 0)
             self.assertTrue(output_path.exists())
 
-            # Verify zip contents
+            # Verify zip contents; scan the pre-parsed central directory and
+            # stop at the first match rather than materializing namelist().
             with zipfile.ZipFile(output_path, "r") as zf:
-                names = zf.namelist()
-                self.assertTrue(any("SKILL.md" in n for n in names))
+                self.assertTrue(any("SKILL.md" in zi.filename for zi in zf.infolist()))
+
+    def test_build_zip_in_memory(self):
+        """build_zip should write to an in-memory file object."""
+        import zipfile
+
+        buf = io.BytesIO()
+        build_zip(VALID_SKILL, buf, "valid-skill")
+        with zipfile.ZipFile(buf) as zf:
+            self.assertTrue(
+                any(zi.filename.endswith("SKILL.md") for zi in zf.infolist())
+            )
 
     def test_install_local(self):
         """Should install from local directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with _tmpdir() as tmpdir:
             dest = Path(tmpdir) / "installed"
             result = self.run_cli(
                 "install",
-                str(FIXTURES_DIR / "valid-skill"),
+                str(VALID_SKILL),
                 "-d",
                 str(dest),
             )
@@ -409,25 +567,15 @@ class TestCLICommands(unittest.TestCase):
 
     def test_install_from_zip(self):
         """Should install from zip file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # First create a zip
-            zip_path = Path(tmpdir) / "skill.zip"
-            self.run_cli(
-                "zip",
-                str(FIXTURES_DIR / "valid-skill"),
-                "-o",
-                str(zip_path),
-            )
-
-            # Then install from it
+        with _tmpdir() as tmpdir:
             dest = Path(tmpdir) / "installed"
-            result = self.run_cli("install", str(zip_path), "-d", str(dest))
+            result = self.run_cli("install", str(self._zip_path), "-d", str(dest))
             self.assertEqual(result.returncode, 0)
             self.assertTrue((dest / "valid-skill" / "SKILL.md").exists())
 
     def test_list_empty(self):
         """Should handle empty skills directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with _tmpdir() as tmpdir:
             result = self.run_cli("list", "-p", tmpdir)
             self.assertEqual(result.returncode, 0)
             self.assertIn("No skills installed", result.stdout)
@@ -442,46 +590,63 @@ class TestCLICommands(unittest.TestCase):
 class TestNameValidation(unittest.TestCase):
     """Tests for skill name validation rules."""
 
+    valid_names = [
+        "my-skill",
+        "skill",
+        "my-awesome-skill",
+        "a",
+        "skill123",
+        "123skill",
+        "my-skill-2",
+    ]
+    invalid_cases = [
+        ("My-Skill", "uppercase"),
+        ("-skill", "starts with hyphen"),
+        ("skill-", "ends with hyphen"),
+        ("my--skill", "consecutive hyphens"),
+        ("my_skill", "underscore"),
+        ("my skill", "space"),
+        ("my.skill", "dot"),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        # One tmpdir for the whole class, with every case's skill directory
+        # written up front in a single batch; os.open/os.write skips
+        # pathlib's text-mode layer for these small constant files.
+        cls._tmp = _tmpdir()
+        cls.tmp_path = Path(cls._tmp.name)
+        cls.valid_dirs = {}
+        cls.invalid_dirs = {}
+        for i, name in enumerate(cls.valid_names):
+            cls.valid_dirs[name] = cls.tmp_path / f"valid-{i}" / name
+        for i, (name, _reason) in enumerate(cls.invalid_cases):
+            slug = name.replace(" ", "-").lower()
+            cls.invalid_dirs[name] = cls.tmp_path / f"invalid-{i}" / slug
+        for name, skill_dir in {**cls.valid_dirs, **cls.invalid_dirs}.items():
+            os.makedirs(skill_dir)
+            fd = os.open(
+                skill_dir / "SKILL.md", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+            )
+            os.write(fd, _SKILL_MD_TMPL % name.encode())
+            os.close(fd)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
     def test_valid_names(self):
         """Should accept valid skill names."""
-        valid_names = [
-            "my-skill",
-            "skill",
-            "my-awesome-skill",
-            "a",
-            "skill123",
-            "123skill",
-            "my-skill-2",
-        ]
-        for name in valid_names:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                skill_dir = Path(tmpdir) / name
-                skill_dir.mkdir()
-                (skill_dir / "SKILL.md").write_text(
-                    f"---\nname: {name}\ndescription: test\n---\n"
-                )
-                errors = validate(skill_dir)
+        for name in self.valid_names:
+            with self.subTest(name=name):
+                errors = validate(self.valid_dirs[name])
                 self.assertEqual(errors, [], f"Name '{name}' should be valid")
 
     def test_invalid_names(self):
         """Should reject invalid skill names."""
-        invalid_cases = [
-            ("My-Skill", "uppercase"),
-            ("-skill", "starts with hyphen"),
-            ("skill-", "ends with hyphen"),
-            ("my--skill", "consecutive hyphens"),
-            ("my_skill", "underscore"),
-            ("my skill", "space"),
-            ("my.skill", "dot"),
-        ]
-        for name, reason in invalid_cases:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                skill_dir = Path(tmpdir) / name.replace(" ", "-").lower()
-                skill_dir.mkdir()
-                (skill_dir / "SKILL.md").write_text(
-                    f"---\nname: {name}\ndescription: test\n---\n"
-                )
-                errors = validate(skill_dir)
+        for name, reason in self.invalid_cases:
+            with self.subTest(name=name, reason=reason):
+                errors = validate(self.invalid_dirs[name])
                 self.assertGreater(
                     len(errors), 0, f"Name '{name}' should be invalid ({reason})"
                 )